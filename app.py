@@ -1,12 +1,10 @@
 import streamlit as st
-import pdfplumber
+import bisect
+import functools
 import io
 import re
-from docx import Document
-from docx.shared import Pt, Inches, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+import types
+from xml.sax.saxutils import escape
 
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # CONSTANTS
@@ -68,6 +66,15 @@ GRADE_LOOKUP = [
     (51, 4.0), (50, 4.0),
 ]
 
+# Ascending split of GRADE_LOOKUP for bisect: the largest threshold <= p is
+# the first matching row of the descending table (first row wins on ties).
+_GRADE_BY_THRESHOLD = {}
+for _threshold, _grade in GRADE_LOOKUP:
+    _GRADE_BY_THRESHOLD.setdefault(_threshold, _grade)
+_GRADE_THRESHOLDS = sorted(_GRADE_BY_THRESHOLD)
+_GRADE_VALUES = [_GRADE_BY_THRESHOLD[t] for t in _GRADE_THRESHOLDS]
+del _threshold, _grade, _GRADE_BY_THRESHOLD
+
 
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # PDF EXTRACTION
@@ -83,6 +90,20 @@ _RE_DATE_SHORT   = re.compile(r'\b(\d{1,2})[./](\d{1,2})[./](\d{4})\b')
 _RE_PROF         = re.compile(r'^Prof[\s.]', re.IGNORECASE)
 _RE_CHAIR        = re.compile(r'^Chair\s+of', re.IGNORECASE)
 _RE_DOB          = re.compile(r'\b\d{2}\.\d{2}\.\d{4}\b')   # date of birth line
+_RE_MASTER_THESIS = re.compile(r'master\s+thesis', re.IGNORECASE)
+_RE_PROF_PREFIX  = re.compile(r'^Prof[\s.]+(?:Dr[\s.]+)?')
+_RE_ID_LINE      = re.compile(r'\d{6,10}')                   # standalone ID line
+_RE_ID_PAREN     = re.compile(r'\((\d{6,10})\)')             # "Matriculation no (XXXXXXX)"
+_RE_LOC_DATE_PAREN = re.compile(r'\(([^,\)]+),\s*(\d{1,2}\.\d{1,2}\.\d{4})\)')
+# Single-pass fallback scan over the page text: standalone ID line,
+# "(XXXXXXX)" ID, or long-form date; dispatched on the named group.
+_RE_FALLBACK     = re.compile(
+    r'^[^\S\n]*(?P<sid>\d{6,10})[^\S\n]*$'
+    r'|\((?P<sid_paren>\d{6,10})\)'
+    r'|(?P<date>' + _RE_DATE_LONG.pattern + r')',
+    re.IGNORECASE | re.MULTILINE)
+# Code points XML 1.0 (and so python-docx) rejects
+_RE_XML_ILLEGAL  = re.compile(r'[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
 
 
 def _is_dob_line(line):
@@ -90,9 +111,50 @@ def _is_dob_line(line):
     return bool(_RE_DOB.search(line))
 
 
+def _preceding_line(raw, pos):
+    """Last non-blank line (stripped) before the line containing pos, or ""."""
+    # Walk back one line at a time instead of copying the whole page prefix
+    end = raw.rfind("\n", 0, pos)
+    while end >= 0:
+        start = raw.rfind("\n", 0, end) + 1
+        line = raw[start:end].strip()
+        if line:
+            return line
+        end = start - 1
+    return ""
+
+
+def _first_page_text(pdf_bytes):
+    """
+    Text of page 0 only. pdfium extracts text natively without building
+    pdfminer layout objects; pdfplumber is kept as a fallback for files
+    pdfium rejects.
+    """
+    try:
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            if len(pdf) == 0:
+                return ""
+            raw = pdf[0].get_textpage().get_text_range() or ""
+            # pdfium joins a line ending in a hyphen with the next one and puts
+            # U+FFFE in place of "-" + break; restore pdfplumber's line layout
+            return _RE_XML_ILLEGAL.sub("", raw.replace("\ufffe", "-\n"))
+        finally:
+            pdf.close()
+    except Exception:
+        import pdfplumber
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            if not pdf.pages:
+                return ""
+            return pdf.pages[0].extract_text() or ""
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
 def extract_title_page_fields(pdf_bytes):
     """
     Extract student/thesis info from the thesis PDF title page.
+    Cached on the PDF bytes, so Streamlit reruns never re-parse the same file.
     Strategy:
       1. Structured parse based on WHU title page layout (Master Thesis Ã¢â€ â€™ title
          Ã¢â€ â€™ Chair Ã¢â€ â€™ Prof. advisor Ã¢â€ â€™ co-advisor Ã¢â€ â€™ location, date Ã¢â€ â€™ name Ã¢â€ â€™ ID).
@@ -109,19 +171,17 @@ def extract_title_page_fields(pdf_bytes):
         "student_id": "",
     }
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            if not pdf.pages:
-                return result
-            raw = pdf.pages[0].extract_text() or ""
+        raw = _first_page_text(pdf_bytes)
 
-        lines = [l.strip() for l in raw.split("\n") if l.strip()]
+        # Strip each line once; filter(None, ...) drops the blank ones
+        lines = list(filter(None, map(str.strip, raw.split("\n"))))
         if not lines:
             return result
 
         # Ã¢â€â‚¬Ã¢â€â‚¬ 1. Find "Master Thesis" header (case-insensitive) Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
         start = 0
         for i, line in enumerate(lines):
-            if re.fullmatch(r'master\s+thesis', line, re.IGNORECASE):
+            if _RE_MASTER_THESIS.fullmatch(line):
                 start = i + 1
                 break
 
@@ -144,7 +204,7 @@ def extract_title_page_fields(pdf_bytes):
                 break
         if advisor_idx < len(lines):
             raw_adv = lines[advisor_idx]
-            result["advisor"] = re.sub(r'^Prof[\s.]+(?:Dr[\s.]+)?', '', raw_adv).strip()
+            result["advisor"] = _RE_PROF_PREFIX.sub('', raw_adv).strip()
 
         # Ã¢â€â‚¬Ã¢â€â‚¬ 4. Co-advisor: line immediately after advisor Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
         co_idx = advisor_idx + 1
@@ -172,7 +232,7 @@ def extract_title_page_fields(pdf_bytes):
                 result["submission_date"] = loc_date
             elif _RE_DATE_SHORT.search(loc_date):
                 # Try "(City, DD.MM.YYYY)" format, e.g. "Submission date (Vallendar, 02.02.2026)"
-                m_paren = re.search(r'\(([^,\)]+),\s*(\d{1,2}\.\d{1,2}\.\d{4})\)', loc_date)
+                m_paren = _RE_LOC_DATE_PAREN.search(loc_date)
                 if m_paren:
                     result["location"] = m_paren.group(1).strip()
                     result["submission_date"] = m_paren.group(2).strip()
@@ -193,49 +253,46 @@ def extract_title_page_fields(pdf_bytes):
         id_idx = name_idx + 1
         if id_idx < len(lines):
             id_line = lines[id_idx]
-            if re.fullmatch(r'\d{6,10}', id_line):
+            if _RE_ID_LINE.fullmatch(id_line):
                 result["student_id"] = id_line
             else:
                 # Handle "Matriculation no (20010551)" style
-                m_id = re.search(r'\((\d{6,10})\)', id_line)
+                m_id = _RE_ID_PAREN.search(id_line)
                 if m_id:
                     result["student_id"] = m_id.group(1)
 
         # Ã¢â€â‚¬Ã¢â€â‚¬ Regex fallbacks for fields still missing Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
-        if not result["student_id"]:
-            # Scan all lines for a standalone 6-10 digit number
-            for i, line in enumerate(lines):
-                m = re.fullmatch(r'\d{6,10}', line)
-                if m:
-                    result["student_id"] = line
-                    if i > 0 and not result["student_name"]:
-                        candidate = lines[i - 1]
-                        if (not _RE_DATE_LONG.search(candidate)
-                                and not _RE_DATE_SHORT.search(candidate)
-                                and not candidate.isdigit()
-                                and not _is_dob_line(candidate)):
-                            result["student_name"] = candidate
+        need_id = not result["student_id"]
+        need_date = not result["submission_date"]
+        if need_id or need_date:
+            # One scan collects the first hit of each kind; a standalone ID
+            # line takes precedence over an ID in parentheses.
+            found = {}
+            for m in _RE_FALLBACK.finditer(raw):
+                if m.group("sid"):
+                    found.setdefault("sid", m)
+                elif m.group("sid_paren"):
+                    found.setdefault("sid_paren", m)
+                else:
+                    found.setdefault("date", m)
+                if ("sid" in found or not need_id) and ("date" in found or not need_date):
                     break
-            # Also handle "Matriculation no (XXXXXXX)" style lines
-            if not result["student_id"]:
-                for i, line in enumerate(lines):
-                    m = re.search(r'\((\d{6,10})\)', line)
-                    if m:
-                        result["student_id"] = m.group(1)
-                        if i > 0 and not result["student_name"]:
-                            candidate = lines[i - 1]
-                            if (not _RE_DATE_LONG.search(candidate)
-                                    and not _RE_DATE_SHORT.search(candidate)
-                                    and not candidate.isdigit()
-                                    and not _is_dob_line(candidate)):
-                                result["student_name"] = candidate
-                        break
-
-        if not result["submission_date"]:
-            # Scan for any long-form date pattern in the full page text
-            m = _RE_DATE_LONG.search(raw)
-            if m:
-                result["submission_date"] = m.group(0)
+
+            m = found.get("sid") or found.get("sid_paren")
+            if need_id and m:
+                result["student_id"] = m.group("sid") or m.group("sid_paren")
+                if not result["student_name"]:
+                    candidate = _preceding_line(raw, m.start())
+                    if (candidate
+                            and not _RE_DATE_LONG.search(candidate)
+                            and not _RE_DATE_SHORT.search(candidate)
+                            and not candidate.isdigit()
+                            and not _is_dob_line(candidate)):
+                        result["student_name"] = candidate
+
+            if need_date and "date" in found:
+                # Any long-form date pattern in the full page text
+                result["submission_date"] = found["date"].group("date")
 
         if not result["thesis_title"] and len(lines) > 1:
             # Use line 1 as a last resort (skip line 0 = "Master Thesis")
@@ -249,6 +306,7 @@ def extract_title_page_fields(pdf_bytes):
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # GRADE CALCULATION
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
+@functools.lru_cache(maxsize=512)
 def convert_points_to_grade(points):
     """Lookup Dezimalnote from OMBA NotenÃƒÂ¼bersicht (table sorted descending)."""
     if points is None:
@@ -256,50 +314,127 @@ def convert_points_to_grade(points):
     p = float(points)
     if p < 50:
         return 5.0
-    for threshold, grade in GRADE_LOOKUP:
-        if threshold <= p:
-            return grade
-    return 5.0  # fallback (should not be reached for p >= 50)
+    return _GRADE_VALUES[bisect.bisect_right(_GRADE_THRESHOLDS, p) - 1]
 
 
+@functools.lru_cache(maxsize=512)
 def compute_weighted_grade(thesis_points, defense_points):
+    """Weighted thesis/defense points and grades (cached; result is read-only)."""
     w_thesis = round(float(thesis_points) * 0.75, 1)
     w_defense = round(float(defense_points) * 0.25, 1)
     combined = round(w_thesis + w_defense, 1)
-    return {
+    return types.MappingProxyType({
         "weighted_thesis": w_thesis,
         "weighted_defense": w_defense,
         "combined_points": combined,
         "thesis_grade": convert_points_to_grade(thesis_points),
         "defense_grade": convert_points_to_grade(defense_points),
         "combined_grade": convert_points_to_grade(combined),
-    }
+    })
 
 
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # DOCX HELPERS
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
-def set_cell_shading(cell, fill_hex):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), fill_hex)
-    tcPr.append(shd)
-
-
-def set_col_width_xml(cell, width_emu):
-    """Force column width via underlying XML (dxa units = EMU / 635)."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcW = OxmlElement("w:tcW")
-    tcW.set(qn("w:w"), str(int(width_emu / 635)))
-    tcW.set(qn("w:type"), "dxa")
-    # Remove any existing tcW
-    for existing in tcPr.findall(qn("w:tcW")):
-        tcPr.remove(existing)
-    tcPr.append(tcW)
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_TBL_LOOK = ('<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+             'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>')
+_RE_RUN_BREAK = re.compile(r'([\t\n\r])')
+
+# Fixed document text shared by both generators
+_SIGNATURE_LINE = "_" * 45
+_SPACER = " " * 10
+_CHECKED = "\u2612"
+_UNCHECKED = "\u2610"
+
+
+def twips(width_emu):
+    """EMU -> dxa (twentieths of a point), truncated like Word's own widths."""
+    return int(width_emu / 635)
+
+
+def run_xml(text, bold=False, size_pt=None):
+    """<w:r> markup for text; tabs/newlines become <w:tab/>/<w:br/> as in python-docx."""
+    rpr = ("<w:b/>" if bold else "") + (f'<w:sz w:val="{int(size_pt * 2)}"/>' if size_pt else "")
+    parts = []
+    for piece in _RE_RUN_BREAK.split(text):
+        if piece == "\t":
+            parts.append("<w:tab/>")
+        elif piece in ("\n", "\r"):
+            parts.append("<w:br/>")
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f"<w:r>{f'<w:rPr>{rpr}</w:rPr>' if rpr else ''}{''.join(parts)}</w:r>"
+
+
+def para_xml(runs="", center=False):
+    ppr = '<w:pPr><w:jc w:val="center"/></w:pPr>' if center else ""
+    return f"<w:p>{ppr}{runs}</w:p>"
+
+
+def _shd_xml(fill_hex):
+    return f'<w:shd w:val="clear" w:color="auto" w:fill="{fill_hex}"/>'
+
+
+def cell_xml(width_dxa, content, fill=None, span=1):
+    """<w:tc> with fixed width, optional shading and horizontal merge (gridSpan)."""
+    tcpr = f'<w:tcW w:w="{width_dxa}" w:type="dxa"/>'
+    if span > 1:
+        tcpr += f'<w:gridSpan w:val="{span}"/>'
+    if fill:
+        tcpr += _shd_xml(fill)
+    return f"<w:tc><w:tcPr>{tcpr}</w:tcPr>{content}</w:tc>"
+
+
+def row_xml(cells, height_pt=None):
+    trpr = f'<w:trPr><w:trHeight w:val="{int(height_pt * 20)}"/></w:trPr>' if height_pt else ""
+    return f"<w:tr>{trpr}{''.join(cells)}</w:tr>"
+
+
+def label_value_rows(col_dxa, rows, label_size_pt=None, value_fills=None):
+    """Rows of a shaded bold label cell next to a 9pt value cell; value_fills maps row index -> fill."""
+    value_fills = value_fills or {}
+    return [
+        row_xml([
+            cell_xml(col_dxa[0], para_xml(run_xml(label, bold=True, size_pt=label_size_pt)), fill="DEEAF1"),
+            cell_xml(col_dxa[1], para_xml(run_xml(value, size_pt=9)), fill=value_fills.get(row_idx)),
+        ])
+        for row_idx, (label, value) in enumerate(rows)
+    ]
+
+
+def numbered_rows(width_dxa, items, height_pt=54):
+    """Single-cell rows "1.  item", "2.  item", ... of fixed height."""
+    return [
+        row_xml([cell_xml(width_dxa, para_xml(
+            run_xml(f"{i+1}.  ", bold=True) + run_xml(item or "", size_pt=9)
+        ))], height_pt=height_pt)
+        for i, item in enumerate(items)
+    ]
+
+
+def add_table_xml(doc, col_dxa, rows):
+    """
+    Append a "Table Grid" table to the document body from pre-built row
+    markup. The whole table is parsed once instead of being assembled
+    through hundreds of python-docx cell/paragraph/run mutations.
+    """
+    from docx.oxml import parse_xml
+    grid = "".join(f'<w:gridCol w:w="{w}"/>' for w in col_dxa)
+    tbl = parse_xml(
+        f'<w:tbl xmlns:w="{_W_NS}"><w:tblPr><w:tblStyle w:val="TableGrid"/>'
+        f'<w:tblW w:w="{sum(col_dxa)}" w:type="dxa"/>{_TBL_LOOK}</w:tblPr>'
+        f'<w:tblGrid>{grid}</w:tblGrid>{"".join(rows)}</w:tbl>'
+    )
+    # Plain lxml on the public document element: body content must stay
+    # ahead of the trailing section properties
+    body = doc.element.body
+    sect_pr = body.find(f"{{{_W_NS}}}sectPr")
+    if sect_pr is not None:
+        sect_pr.addprevious(tbl)
+    else:
+        body.append(tbl)
+    return tbl
 
 
 def set_page_layout(doc):
@@ -315,14 +450,48 @@ def set_page_layout(doc):
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # DOCX GENERATION Ã¢â‚¬â€œ PART 1
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
+# Grade column mapping: col 1 = Excellent Ã¢â‚¬Â¦ col 7 = N/A
+_GRADE_TO_COL = (
+    ("Excellent", 1), ("Very Good", 2), ("Good", 3),
+    ("Satisfactory", 4), ("Sufficient", 5), ("Fail", 6), ("N/A", 7),
+)
+_GRADE_TO_COL_DICT = dict(_GRADE_TO_COL)
+
+# Rubric column widths (EMU): criterion label + 7 grade columns
+_RUBRIC_COL_WIDTHS = (2017395, 700405, 678180, 678180, 719455, 701675, 667385, 705485)
+_RUBRIC_COL_DXA = tuple(twips(w) for w in _RUBRIC_COL_WIDTHS)
+
+# Pre-rendered checkbox cells per grade column: (unchecked, checked) markup,
+# so a criterion row only picks 7 ready-made strings
+_CHECK_CELLS = {
+    col_idx: tuple(
+        cell_xml(_RUBRIC_COL_DXA[col_idx], para_xml(run_xml(mark, size_pt=11), center=True))
+        for mark in (_UNCHECKED, _CHECKED)
+    )
+    for _, col_idx in _GRADE_TO_COL
+}
+
+_COL_HEADERS = (
+    "Evaluation Criteria",
+    "Excellent\n(+,-)",
+    "Very Good\n(+,-)",
+    "Good\n(+,-)",
+    "Satisfactory\n(+,-)",
+    "Sufficient\n(+,-)",
+    "Fail\n(+,-)",
+    "Not\nApplicable",
+)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
 def generate_part1_docx(data):
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+
     doc = Document()
     set_page_layout(doc)
 
-    # Remove default empty paragraph
-    for para in doc.paragraphs:
-        para.clear()
-
     # Title
     title = doc.add_heading("Master Thesis Evaluation", level=1)
     title.alignment = WD_ALIGN_PARAGRAPH.LEFT
@@ -330,7 +499,7 @@ def generate_part1_docx(data):
     # Header info
     p = doc.add_paragraph()
     p.add_run("Student Name:  ").bold = True
-    p.add_run(data["student_name"] + "          ")
+    p.add_run(data["student_name"] + _SPACER)
     p.add_run("Student ID:  ").bold = True
     p.add_run(data["student_id"])
 
@@ -340,9 +509,9 @@ def generate_part1_docx(data):
 
     p = doc.add_paragraph()
     p.add_run("Submission Date:  ").bold = True
-    p.add_run(data["submission_date"] + "          ")
+    p.add_run(data["submission_date"] + _SPACER)
     p.add_run("First Supervisor:  ").bold = True
-    p.add_run(data["first_supervisor"] + "          ")
+    p.add_run(data["first_supervisor"] + _SPACER)
     p.add_run("Second Supervisor:  ").bold = True
     p.add_run(data["second_supervisor"])
 
@@ -357,114 +526,51 @@ def generate_part1_docx(data):
     # Ã¢â€â‚¬Ã¢â€â‚¬ Rubric Table Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
     # 8 columns: Criterion | Excellent | Very Good | Good | Satisfactory | Sufficient | Fail | N/A
     # Rows: 1 merged title + 1 column headers + 9 criteria Ãƒâ€” 2 rows + 1 total = 21
-    col_widths = [2017395, 700405, 678180, 678180, 719455, 701675, 667385, 705485]
-    num_criteria = len(data["criteria"])
-    num_rows = 2 + num_criteria * 2 + 1
-
-    table = doc.add_table(rows=num_rows, cols=8)
-    table.style = "Table Grid"
-
-    # Apply column widths to every cell
-    for col_idx, w in enumerate(col_widths):
-        for cell in table.columns[col_idx].cells:
-            cell.width = w
-            set_col_width_xml(cell, w)
+    col_dxa = _RUBRIC_COL_DXA
+    full_dxa = sum(col_dxa)
 
     # Row 0: merged title header
-    row0 = table.rows[0]
-    row0.cells[0].merge(row0.cells[7])
-    p = row0.cells[0].paragraphs[0]
-    run = p.add_run("Evaluation of the Written Thesis")
-    run.bold = True
-    run.font.size = Pt(11)
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    set_cell_shading(row0.cells[0], "BDD7EE")
+    rows = [row_xml([cell_xml(
+        full_dxa,
+        para_xml(run_xml("Evaluation of the Written Thesis", bold=True, size_pt=11), center=True),
+        fill="BDD7EE", span=8,
+    )])]
 
     # Row 1: column headers
-    col_headers = [
-        "Evaluation Criteria",
-        "Excellent\n(+,-)",
-        "Very Good\n(+,-)",
-        "Good\n(+,-)",
-        "Satisfactory\n(+,-)",
-        "Sufficient\n(+,-)",
-        "Fail\n(+,-)",
-        "Not\nApplicable",
-    ]
-    row1 = table.rows[1]
-    for i, text in enumerate(col_headers):
-        cell = row1.cells[i]
-        cell.text = ""
-        p = cell.paragraphs[0]
-        run = p.add_run(text)
-        run.bold = True
-        run.font.size = Pt(8)
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_cell_shading(cell, "DEEAF1")
-
-    # Grade column mapping: col 1 = Excellent Ã¢â‚¬Â¦ col 7 = N/A
-    grade_to_col = {
-        "Excellent": 1, "Very Good": 2, "Good": 3,
-        "Satisfactory": 4, "Sufficient": 5, "Fail": 6, "N/A": 7,
-    }
+    rows.append(row_xml([
+        cell_xml(w, para_xml(run_xml(text, bold=True, size_pt=8), center=True), fill="DEEAF1")
+        for w, text in zip(col_dxa, _COL_HEADERS)
+    ]))
 
-    actual_labels = CRITERIA_LABELS[:8] + [data.get("criterion_9_label", "[Own criterion]")]
+    actual_labels = (*CRITERIA_LABELS[:8], data.get("criterion_9_label", "[Own criterion]"))
 
     for i, crit in enumerate(data["criteria"]):
-        base = 2 + i * 2
-        comm = base + 1
-
-        # Criterion row
-        crit_row = table.rows[base]
-
-        # Col 0: criterion name
-        crit_row.cells[0].text = ""
-        p = crit_row.cells[0].paragraphs[0]
-        run = p.add_run(f"{i+1}. {actual_labels[i]}")
-        run.bold = True
-        run.font.size = Pt(9)
-
-        # Cols 1-7: checkboxes
-        selected = crit["grade_level"]
-        for grade, col_idx in grade_to_col.items():
-            crit_row.cells[col_idx].text = ""
-            p = crit_row.cells[col_idx].paragraphs[0]
-            p.add_run("\u2612" if selected == grade else "\u2610")
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.runs[0].font.size = Pt(11)
-
-        # Comments row Ã¢â‚¬â€œ merge across all 8 cols
-        comm_row = table.rows[comm]
-        comm_row.cells[0].merge(comm_row.cells[7])
-        comm_row.cells[0].text = ""
-        p = comm_row.cells[0].paragraphs[0]
-        p.add_run("Comments/Examples:  ").bold = True
-        p.add_run(crit["comments"] or "")
-        p.runs[-1].font.size = Pt(9)
-        comm_row.height = Pt(36)
-
-    # Total row
-    total_row_idx = 2 + num_criteria * 2
-    total_row = table.rows[total_row_idx]
-
-    # Col 0: "Total Points" label
-    total_row.cells[0].text = ""
-    p = total_row.cells[0].paragraphs[0]
-    run = p.add_run("Total Points")
-    run.bold = True
-    run.font.size = Pt(9)
-
-    # Merge cols 1-7 for score/grade display
-    total_row.cells[1].merge(total_row.cells[7])
-    total_row.cells[1].text = ""
-    p = total_row.cells[1].paragraphs[0]
-    p.add_run(
+        # Criterion row: col 0 criterion name, cols 1-7 checkboxes
+        cells = [cell_xml(col_dxa[0], para_xml(
+            run_xml(f"{i+1}. {actual_labels[i]}", bold=True, size_pt=9)))]
+        sel_col = _GRADE_TO_COL_DICT.get(crit["grade_level"])
+        cells.extend(_CHECK_CELLS[col_idx][col_idx == sel_col] for _, col_idx in _GRADE_TO_COL)
+        rows.append(row_xml(cells))
+
+        # Comments row - merged across all 8 cols
+        rows.append(row_xml([cell_xml(full_dxa, para_xml(
+            run_xml("Comments/Examples:  ", bold=True)
+            + run_xml(crit["comments"] or "", size_pt=9)
+        ), span=8)], height_pt=36))
+
+    # Total row: "Total Points" label, cols 1-7 merged for score/grade display
+    total_text = (
         f"{data['total_points']} / 100     "
         f"Dezimalnote: {data['thesis_grade']}     "
         f"Weighted Points: {data['weighted_points']} / 75"
-    ).font.size = Pt(9)
-    set_cell_shading(total_row.cells[0], "FFF2CC")
-    set_cell_shading(total_row.cells[1], "FFF2CC")
+    )
+    rows.append(row_xml([
+        cell_xml(col_dxa[0], para_xml(run_xml("Total Points", bold=True, size_pt=9)), fill="FFF2CC"),
+        cell_xml(full_dxa - col_dxa[0], para_xml(run_xml(total_text, size_pt=9)),
+                 fill="FFF2CC", span=7),
+    ]))
+
+    add_table_xml(doc, col_dxa, rows)
 
     # Ã¢â€â‚¬Ã¢â€â‚¬ Scoring summary Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
     doc.add_paragraph()
@@ -494,29 +600,29 @@ def generate_part1_docx(data):
         decision = data.get("third_assessor_decision", "")
         proposed = data.get("third_assessor_proposed_grade", "")
         if decision.startswith("I confirm"):
-            doc.add_paragraph("\u2612  I confirm the evaluation of the first assessor")
-            doc.add_paragraph("\u2610  I propose a change of points/grade: ________")
+            doc.add_paragraph(f"{_CHECKED}  I confirm the evaluation of the first assessor")
+            doc.add_paragraph(f"{_UNCHECKED}  I propose a change of points/grade: ________")
         else:
-            doc.add_paragraph("\u2610  I confirm the evaluation of the first assessor")
+            doc.add_paragraph(f"{_UNCHECKED}  I confirm the evaluation of the first assessor")
             p = doc.add_paragraph()
-            p.add_run(f"\u2612  I propose a change of points/grade: {proposed}")
+            p.add_run(f"{_CHECKED}  I propose a change of points/grade: {proposed}")
 
         doc.add_paragraph()
         p = doc.add_paragraph()
         p.add_run("Signature Third Assessor: ").bold = True
-        p.add_run("_" * 45)
+        p.add_run(_SIGNATURE_LINE)
 
     # Ã¢â€â‚¬Ã¢â€â‚¬ Signatures Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
     doc.add_paragraph()
     doc.add_paragraph()
     p = doc.add_paragraph()
     p.add_run("Signature First Supervisor: ").bold = True
-    p.add_run("_" * 45)
+    p.add_run(_SIGNATURE_LINE)
 
     doc.add_paragraph()
     p = doc.add_paragraph()
     p.add_run("Signature Second Supervisor: ").bold = True
-    p.add_run("_" * 45)
+    p.add_run(_SIGNATURE_LINE)
 
     buf = io.BytesIO()
     doc.save(buf)
@@ -527,20 +633,22 @@ def generate_part1_docx(data):
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # DOCX GENERATION Ã¢â‚¬â€œ PART 2
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
+@st.cache_data(show_spinner=False, max_entries=16)
 def generate_part2_docx(data):
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt, Inches
+
     doc = Document()
     set_page_layout(doc)
 
-    for para in doc.paragraphs:
-        para.clear()
-
     # Ã¢â€â‚¬Ã¢â€â‚¬ SECTION 1: Defense Evaluation Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
     h = doc.add_heading("Master Thesis Defense", level=1)
     h.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     p = doc.add_paragraph()
     p.add_run("Student Name:  ").bold = True
-    p.add_run(data["student_name"] + "          ")
+    p.add_run(data["student_name"] + _SPACER)
     p.add_run("Student ID:  ").bold = True
     p.add_run(data["student_id"])
 
@@ -563,7 +671,7 @@ def generate_part2_docx(data):
     p.add_run(f"{data['defense_points']} / 100          ")
     p.add_run("Grade: ").bold = True
     p.add_run(str(data["defense_grade"]))
-    p.add_run("          ")
+    p.add_run(_SPACER)
     p.add_run("Weighted Points: ").bold = True
     p.add_run(f"{data['weighted_defense']} / 25")
 
@@ -573,14 +681,7 @@ def generate_part2_docx(data):
     h = doc.add_paragraph()
     h.add_run("Evaluation of the Master Thesis (Overall)").bold = True
 
-    combined_table = doc.add_table(rows=3, cols=2)
-    combined_table.style = "Table Grid"
-    for cell in combined_table.columns[0].cells:
-        cell.width = Inches(2.2)
-        set_col_width_xml(cell, int(2.2 * 914400))
-    for cell in combined_table.columns[1].cells:
-        cell.width = Inches(4.1)
-        set_col_width_xml(cell, int(4.1 * 914400))
+    combined_dxa = [twips(Inches(2.2)), twips(Inches(4.1))]
 
     passed = "Yes" if data["defense_points"] >= 50 else "No"
     combined_rows = [
@@ -596,28 +697,19 @@ def generate_part2_docx(data):
          f"{data['combined_points']} / 100    "
          f"Grade: {data['combined_grade']}"),
     ]
-    for row_idx, (label, value) in enumerate(combined_rows):
-        row = combined_table.rows[row_idx]
-        row.cells[0].text = ""
-        row.cells[0].paragraphs[0].add_run(label).bold = True
-        row.cells[0].paragraphs[0].runs[0].font.size = Pt(9)
-        row.cells[1].text = ""
-        run = row.cells[1].paragraphs[0].add_run(value)
-        run.font.size = Pt(9)
-        set_cell_shading(row.cells[0], "DEEAF1")
-        if row_idx == 2:
-            set_cell_shading(row.cells[1], "FFF2CC")
+    add_table_xml(doc, combined_dxa,
+                  label_value_rows(combined_dxa, combined_rows, value_fills={2: "FFF2CC"}))
 
     doc.add_paragraph()
     doc.add_paragraph()
 
     p = doc.add_paragraph()
     p.add_run("Signature First Supervisor: ").bold = True
-    p.add_run("_" * 45)
+    p.add_run(_SIGNATURE_LINE)
     doc.add_paragraph()
     p = doc.add_paragraph()
     p.add_run("Signature Second Supervisor: ").bold = True
-    p.add_run("_" * 45)
+    p.add_run(_SIGNATURE_LINE)
 
     # Ã¢â€â‚¬Ã¢â€â‚¬ PAGE BREAK Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
     doc.add_page_break()
@@ -627,14 +719,7 @@ def generate_part2_docx(data):
     h.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     # Protocol table (10 rows Ãƒâ€” 2 cols)
-    proto_table = doc.add_table(rows=10, cols=2)
-    proto_table.style = "Table Grid"
-    for cell in proto_table.columns[0].cells:
-        cell.width = Inches(1.97)
-        set_col_width_xml(cell, int(1.97 * 914400))
-    for cell in proto_table.columns[1].cells:
-        cell.width = Inches(4.33)
-        set_col_width_xml(cell, int(4.33 * 914400))
+    proto_dxa = [twips(Inches(1.97)), twips(Inches(4.33))]
 
     time_str = f"{data['time_start']} \u2013 {data['time_end']}"
     examiners_str = (
@@ -653,17 +738,7 @@ def generate_part2_docx(data):
         ("Examiners",            examiners_str),
         ("Group work?",          data["group_work"]),
     ]
-    for row_idx, (label, value) in enumerate(proto_rows):
-        row = proto_table.rows[row_idx]
-        row.cells[0].text = ""
-        run = row.cells[0].paragraphs[0].add_run(label)
-        run.bold = True
-        run.font.size = Pt(9)
-        set_cell_shading(row.cells[0], "DEEAF1")
-        row.cells[1].text = value
-        for para in row.cells[1].paragraphs:
-            for r in para.runs:
-                r.font.size = Pt(9)
+    add_table_xml(doc, proto_dxa, label_value_rows(proto_dxa, proto_rows, label_size_pt=9))
 
     doc.add_paragraph()
 
@@ -671,20 +746,8 @@ def generate_part2_docx(data):
     h = doc.add_paragraph()
     h.add_run("3. Topics and Questions").bold = True
 
-    topics_table = doc.add_table(rows=6, cols=1)
-    topics_table.style = "Table Grid"
-    for cell in topics_table.columns[0].cells:
-        cell.width = Inches(6.3)
-        set_col_width_xml(cell, int(6.3 * 914400))
-
-    for i, topic in enumerate(data["topics"]):
-        row = topics_table.rows[i]
-        row.cells[0].text = ""
-        p = row.cells[0].paragraphs[0]
-        p.add_run(f"{i+1}.  ").bold = True
-        p.add_run(topic or "")
-        p.runs[-1].font.size = Pt(9)
-        row.height = Pt(54)
+    topics_dxa = [twips(Inches(6.3))]
+    add_table_xml(doc, topics_dxa, numbered_rows(topics_dxa[0], data["topics"]))
 
     doc.add_paragraph()
 
@@ -692,20 +755,8 @@ def generate_part2_docx(data):
     h = doc.add_paragraph()
     h.add_run("4. Candidate's Answers").bold = True
 
-    answers_table = doc.add_table(rows=6, cols=1)
-    answers_table.style = "Table Grid"
-    for cell in answers_table.columns[0].cells:
-        cell.width = Inches(6.3)
-        set_col_width_xml(cell, int(6.3 * 914400))
-
-    for i, answer in enumerate(data["answers"]):
-        row = answers_table.rows[i]
-        row.cells[0].text = ""
-        p = row.cells[0].paragraphs[0]
-        p.add_run(f"{i+1}.  ").bold = True
-        p.add_run(answer or "")
-        p.runs[-1].font.size = Pt(9)
-        row.height = Pt(54)
+    answers_dxa = [twips(Inches(6.3))]
+    add_table_xml(doc, answers_dxa, numbered_rows(answers_dxa[0], data["answers"]))
 
     doc.add_paragraph()
 
@@ -729,27 +780,19 @@ def generate_part2_docx(data):
     doc.add_paragraph()
 
     # Examiner signature table
-    sig_table = doc.add_table(rows=2, cols=2)
-    sig_table.style = "Table Grid"
-    for cell in sig_table.columns[0].cells:
-        cell.width = Inches(3.0)
-        set_col_width_xml(cell, int(3.0 * 914400))
-    for cell in sig_table.columns[1].cells:
-        cell.width = Inches(3.3)
-        set_col_width_xml(cell, int(3.3 * 914400))
-
-    sig_table.rows[0].cells[0].text = "First Examiner (Name / Date / Signature)"
-    sig_table.rows[0].cells[1].text = "Second Examiner (Name / Date / Signature)"
-    for cell in sig_table.rows[0].cells:
-        for para in cell.paragraphs:
-            for run in para.runs:
-                run.bold = True
-                run.font.size = Pt(9)
-        set_cell_shading(cell, "DEEAF1")
-
-    sig_table.rows[1].cells[0].text = f"\n{data['first_examiner']}\n\n"
-    sig_table.rows[1].cells[1].text = f"\n{data['second_examiner']}\n\n"
-    sig_table.rows[1].height = Pt(80)
+    sig_dxa = [twips(Inches(3.0)), twips(Inches(3.3))]
+    add_table_xml(doc, sig_dxa, [
+        row_xml([
+            cell_xml(sig_dxa[0], para_xml(run_xml(
+                "First Examiner (Name / Date / Signature)", bold=True, size_pt=9)), fill="DEEAF1"),
+            cell_xml(sig_dxa[1], para_xml(run_xml(
+                "Second Examiner (Name / Date / Signature)", bold=True, size_pt=9)), fill="DEEAF1"),
+        ]),
+        row_xml([
+            cell_xml(sig_dxa[0], para_xml(run_xml(f"\n{data['first_examiner']}\n\n"))),
+            cell_xml(sig_dxa[1], para_xml(run_xml(f"\n{data['second_examiner']}\n\n"))),
+        ], height_pt=80),
+    ])
 
     buf = io.BytesIO()
     doc.save(buf)
@@ -763,6 +806,9 @@ def generate_part2_docx(data):
 # SESSION STATE
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 def init_session_state():
+    # Defaults only need seeding once per session; later reruns skip the key scan
+    if st.session_state.get("_initialized"):
+        return
     defaults = {
         "student_name": "",
         "student_id": "",
@@ -772,10 +818,8 @@ def init_session_state():
         "first_supervisor": DEFAULT_SUPERVISOR_1,
         "second_supervisor": DEFAULT_SUPERVISOR_2,
         "thesis_points": 0,
-        "criteria": [
-            {"grade_level": "N/A", "comments": ""}
-            for _ in range(9)
-        ],
+        "criteria_grades": ["N/A"] * 9,
+        "criteria_comments": [""] * 9,
         "criterion_9_label": "[Own criterion]",
         "general_comments_p1": "",
         "defense_program": "",
@@ -791,21 +835,21 @@ def init_session_state():
         "special_circumstances": "",
         "defense_points": 0,
         "pdf_extracted": False,
+        "pdf_upload_gen": 0,
         "third_assessor_decision": "I confirm the evaluation of the first assessor",
         "third_assessor_proposed_grade": "",
     }
     for key, val in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = val
+    st.session_state["_initialized"] = True
 
 
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
 # DATA COLLECTORS
 # Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
-def collect_part1_data():
+def collect_part1_data(grades):
     total_pts = st.session_state.thesis_points or 0
-    defense_pts = st.session_state.defense_points or 0
-    grades = compute_weighted_grade(total_pts, defense_pts)
     return {
         "student_name": st.session_state.student_name,
         "student_id": st.session_state.student_id,
@@ -814,7 +858,11 @@ def collect_part1_data():
         "first_supervisor": st.session_state.first_supervisor,
         "second_supervisor": st.session_state.second_supervisor,
         "general_comments": st.session_state.general_comments_p1,
-        "criteria": st.session_state.criteria,
+        "criteria": [
+            {"grade_level": grade, "comments": comment}
+            for grade, comment in zip(st.session_state.criteria_grades,
+                                      st.session_state.criteria_comments)
+        ],
         "criterion_9_label": st.session_state.criterion_9_label,
         "total_points": total_pts,
         "thesis_grade": grades["thesis_grade"],
@@ -825,10 +873,9 @@ def collect_part1_data():
     }
 
 
-def collect_part2_data():
+def collect_part2_data(grades):
     total_thesis = st.session_state.thesis_points or 0
     defense_pts = st.session_state.defense_points or 0
-    grades = compute_weighted_grade(total_thesis, defense_pts)
     return {
         "student_name": st.session_state.student_name,
         "student_id": st.session_state.student_id,
@@ -898,6 +945,22 @@ def render_sidebar():
 
 
 
+def _clear_pdf_fields(field_map):
+    """
+    on_click for "Clear / Re-upload PDF". Callbacks run before the script,
+    so the header fields and a fresh, empty uploader are drawn on this pass.
+    """
+    # Reset backing vars and widget keys so header fields go blank
+    for _, backing_key, widget_key in field_map:
+        st.session_state[backing_key] = ""
+        if widget_key in st.session_state:
+            del st.session_state[widget_key]
+    st.session_state.pdf_extracted = False
+    # New uploader key: drops the old file so it cannot be re-extracted over
+    # whatever is typed into the blank header fields
+    st.session_state.pdf_upload_gen += 1
+
+
 def render_pdf_upload():
     # Maps: extracted field key -> (backing state key, header widget key)
     FIELD_MAP = [
@@ -910,18 +973,22 @@ def render_pdf_upload():
     ]
 
     with st.expander("Upload Thesis PDF - auto-fill from title page", expanded=not st.session_state.pdf_extracted):
-        uploaded = st.file_uploader("Choose thesis PDF", type=["pdf"], key="pdf_uploader")
+        # The generation in the key lets "Clear" hand out a fresh, empty uploader
+        uploaded = st.file_uploader(
+            "Choose thesis PDF", type=["pdf"],
+            key=f"pdf_uploader_{st.session_state.pdf_upload_gen}",
+        )
 
         if uploaded is not None and not st.session_state.pdf_extracted:
             with st.spinner("Extracting title page fields..."):
-                fields = extract_title_page_fields(uploaded.read())
+                fields = extract_title_page_fields(uploaded.getvalue())
 
             populated = []
             for field_key, backing_key, widget_key in FIELD_MAP:
                 val = fields.get(field_key, "").strip()
                 if val:
-                    # Write to BOTH the backing var AND the widget key so the
-                    # text_input widget reflects the new value after st.rerun()
+                    # Write to BOTH the backing var AND the widget key; the header
+                    # widgets are created after this, so they show it on this pass
                     st.session_state[backing_key] = val
                     st.session_state[widget_key] = val
                     populated.append(field_key)
@@ -935,19 +1002,11 @@ def render_pdf_upload():
                     f"Thesis: *{fields.get('thesis_title', '')[:80]}*  \n"
                     f"Date: {fields.get('submission_date') or '-'}"
                 )
-                st.rerun()   # re-render so text_input widgets show extracted values
             else:
                 st.warning("Could not extract fields automatically. Please fill in manually.")
 
         if st.session_state.pdf_extracted:
-            if st.button("Clear / Re-upload PDF"):
-                # Reset backing vars and widget keys so header fields go blank
-                for _, backing_key, widget_key in FIELD_MAP:
-                    st.session_state[backing_key] = ""
-                    if widget_key in st.session_state:
-                        del st.session_state[widget_key]
-                st.session_state.pdf_extracted = False
-                st.rerun()
+            st.button("Clear / Re-upload PDF", on_click=_clear_pdf_fields, args=(FIELD_MAP,))
 
 
 def render_header_fields():
@@ -986,50 +1045,40 @@ def render_part1():
     st.subheader("Evaluation Criteria")
     st.info("Select a grade level for each criterion and add comments where relevant.")
 
-    # Column headers
-    hcols = st.columns([2.5, 2.5, 3.5])
-    hcols[0].markdown("**Criterion**")
-    hcols[1].markdown("**Grade Level**")
-    hcols[2].markdown("**Comments / Examples**")
-    st.divider()
-
-    for i in range(9):
-        col_label, col_grade, col_comment = st.columns([2.5, 2.5, 3.5])
+    # Criteria edits are buffered in a form and applied together on submit
+    with st.form("part1_form", clear_on_submit=False):
+        st.session_state.criterion_9_label = st.text_input(
+            "Criterion 9 label (editable)",
+            value=st.session_state.criterion_9_label,
+            key="crit9_label_input",
+        )
 
-        if i == 8:
-            with col_label:
-                new_label = st.text_input(
-                    "Criterion 9 label (editable)",
-                    value=st.session_state.criterion_9_label,
-                    key="crit9_label_input",
-                )
-                st.session_state.criterion_9_label = new_label
-                st.markdown(f"**9. {new_label}**")
-        else:
-            col_label.markdown(f"**{i+1}. {CRITERIA_LABELS[i]}**")
-
-        with col_grade:
-            cur_grade = st.session_state.criteria[i]["grade_level"]
-            grade_level = st.radio(
-                f"grade_{i}",
-                options=GRADE_LEVELS,
-                index=GRADE_LEVELS.index(cur_grade),
-                key=f"input_grade_{i}",
-                label_visibility="collapsed",
-            )
-            st.session_state.criteria[i]["grade_level"] = grade_level
-
-        with col_comment:
-            comment = st.text_area(
-                f"comment_{i}",
-                value=st.session_state.criteria[i]["comments"],
-                height=120,
-                label_visibility="collapsed",
-                key=f"input_comment_{i}",
-            )
-            st.session_state.criteria[i]["comments"] = comment
+        # One grid widget for all 9 criteria instead of a radio + text area per row
+        labels = CRITERIA_LABELS[:8] + [st.session_state.criterion_9_label]
+        edited = st.data_editor(
+            [
+                {"Criterion": f"{i+1}. {label}",
+                 "Grade Level": grade,
+                 "Comments / Examples": comment}
+                for i, (label, grade, comment) in enumerate(zip(
+                    labels, st.session_state.criteria_grades, st.session_state.criteria_comments))
+            ],
+            column_config={
+                "Criterion": st.column_config.TextColumn(width="medium"),
+                "Grade Level": st.column_config.SelectboxColumn(
+                    options=GRADE_LEVELS, required=True),
+                "Comments / Examples": st.column_config.TextColumn(width="large"),
+            },
+            disabled=["Criterion"],
+            hide_index=True,
+            num_rows="fixed",
+            width="stretch",
+            key="criteria_editor",
+        )
+        st.session_state.criteria_grades = [row["Grade Level"] for row in edited]
+        st.session_state.criteria_comments = [row["Comments / Examples"] or "" for row in edited]
 
-        st.divider()
+        st.form_submit_button("Update Criteria")
 
     # Total points (entered directly by the evaluator)
     st.subheader("Scoring")
@@ -1072,88 +1121,91 @@ def render_part1():
 def render_part2():
     st.header("Part 2: Defense Evaluation")
 
-    # Defense date
-    st.session_state.defense_date = st.text_input(
-        "Defense Date", value=st.session_state.defense_date, key="p2_defense_date"
-    )
-
-    # Defense Protocol
-    st.subheader("Defense Protocol")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.session_state.defense_program = st.text_input(
-            "Program", value=st.session_state.defense_program, key="p2_program"
+    # Inputs are buffered in a form so editing them does not rerun the app
+    with st.form("part2_form", clear_on_submit=False):
+        # Defense date
+        st.session_state.defense_date = st.text_input(
+            "Defense Date", value=st.session_state.defense_date, key="p2_defense_date"
         )
-        tc1, tc2 = st.columns(2)
-        with tc1:
-            st.session_state.defense_time_start = st.text_input(
-                "Time Start", value=st.session_state.defense_time_start, key="p2_tstart"
+
+        # Defense Protocol
+        st.subheader("Defense Protocol")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.session_state.defense_program = st.text_input(
+                "Program", value=st.session_state.defense_program, key="p2_program"
             )
-        with tc2:
-            st.session_state.defense_time_end = st.text_input(
-                "Time End", value=st.session_state.defense_time_end, key="p2_tend"
+            tc1, tc2 = st.columns(2)
+            with tc1:
+                st.session_state.defense_time_start = st.text_input(
+                    "Time Start", value=st.session_state.defense_time_start, key="p2_tstart"
+                )
+            with tc2:
+                st.session_state.defense_time_end = st.text_input(
+                    "Time End", value=st.session_state.defense_time_end, key="p2_tend"
+                )
+            st.session_state.defense_mode = st.selectbox(
+                "Mode",
+                options=["In Person", "Online"],
+                index=0 if st.session_state.defense_mode == "In Person" else 1,
+                key="p2_mode",
+            )
+        with col2:
+            st.session_state.defense_location_link = st.text_input(
+                "Location / Meeting Link",
+                value=st.session_state.defense_location_link, key="p2_location"
+            )
+            st.session_state.defense_first_examiner = st.text_input(
+                "First Examiner",
+                value=st.session_state.defense_first_examiner, key="p2_exam1"
+            )
+            st.session_state.defense_second_examiner = st.text_input(
+                "Second Examiner",
+                value=st.session_state.defense_second_examiner, key="p2_exam2"
+            )
+            st.session_state.defense_group_work = st.selectbox(
+                "Group Work?", options=["No", "Yes"], key="p2_groupwork"
             )
-        st.session_state.defense_mode = st.selectbox(
-            "Mode",
-            options=["In Person", "Online"],
-            index=0 if st.session_state.defense_mode == "In Person" else 1,
-            key="p2_mode",
-        )
-    with col2:
-        st.session_state.defense_location_link = st.text_input(
-            "Location / Meeting Link",
-            value=st.session_state.defense_location_link, key="p2_location"
-        )
-        st.session_state.defense_first_examiner = st.text_input(
-            "First Examiner",
-            value=st.session_state.defense_first_examiner, key="p2_exam1"
-        )
-        st.session_state.defense_second_examiner = st.text_input(
-            "Second Examiner",
-            value=st.session_state.defense_second_examiner, key="p2_exam2"
-        )
-        st.session_state.defense_group_work = st.selectbox(
-            "Group Work?", options=["No", "Yes"], key="p2_groupwork"
-        )
 
-    # Topics & Questions
-    st.subheader("Topics and Questions")
-    for i in range(6):
-        st.session_state.topics[i] = st.text_area(
-            f"Question {i+1}",
-            value=st.session_state.topics[i],
-            height=80,
-            key=f"p2_topic_{i}",
+        # Topics & Questions / Candidate Answers, one grid row per question
+        st.subheader("Topics, Questions and Candidate's Answers")
+        edited = st.data_editor(
+            [
+                {"Question": topic, "Answer": answer}
+                for topic, answer in zip(st.session_state.topics, st.session_state.answers)
+            ],
+            column_config={
+                "Question": st.column_config.TextColumn(width="large"),
+                "Answer": st.column_config.TextColumn(width="large"),
+            },
+            hide_index=True,
+            num_rows="fixed",
+            width="stretch",
+            key="qa_editor",
         )
-
-    # Candidate Answers
-    st.subheader("Candidate's Answers")
-    for i in range(6):
-        st.session_state.answers[i] = st.text_area(
-            f"Answer {i+1}",
-            value=st.session_state.answers[i],
-            height=80,
-            key=f"p2_answer_{i}",
+        st.session_state.topics = [row["Question"] or "" for row in edited]
+        st.session_state.answers = [row["Answer"] or "" for row in edited]
+
+        # Special Circumstances / Incidents
+        st.subheader("Special Circumstances / Incidents")
+        st.session_state.special_circumstances = st.text_area(
+            "Describe any special circumstances or incidents during the defense",
+            value=st.session_state.special_circumstances,
+            height=120,
+            key="p2_special_circumstances",
         )
 
-    # Special Circumstances / Incidents
-    st.subheader("Special Circumstances / Incidents")
-    st.session_state.special_circumstances = st.text_area(
-        "Describe any special circumstances or incidents during the defense",
-        value=st.session_state.special_circumstances,
-        height=120,
-        key="p2_special_circumstances",
-    )
+        # Defense Evaluation
+        st.subheader("Defense Score")
+        st.session_state.defense_points = st.number_input(
+            "Defense Points (0-100)",
+            min_value=0, max_value=100,
+            value=st.session_state.defense_points,
+            step=1,
+            key="p2_defense_pts",
+        )
 
-    # Defense Evaluation
-    st.subheader("Defense Score")
-    st.session_state.defense_points = st.number_input(
-        "Defense Points (0-100)",
-        min_value=0, max_value=100,
-        value=st.session_state.defense_points,
-        step=1,
-        key="p2_defense_pts",
-    )
+        st.form_submit_button("Update Defense Evaluation")
 
     defense_pts = st.session_state.defense_points
     total_thesis = st.session_state.thesis_points or 0
@@ -1168,7 +1220,7 @@ def render_part2():
         st.error("Defense score is below the minimum passing threshold of 50 points.")
 
 
-def render_downloads():
+def render_downloads(grades):
     st.divider()
     st.subheader("Download Evaluation Documents")
     col1, col2 = st.columns(2)
@@ -1177,7 +1229,7 @@ def render_downloads():
 
     with col1:
         st.markdown("**Part 1 - Written Thesis Evaluation**")
-        data_p1 = collect_part1_data()
+        data_p1 = collect_part1_data(grades)
         buf_p1 = generate_part1_docx(data_p1)
         st.download_button(
             label="Download Part 1 (DOCX)",
@@ -1189,7 +1241,7 @@ def render_downloads():
 
     with col2:
         st.markdown("**Part 2 - Defense Evaluation & Protocol**")
-        data_p2 = collect_part2_data()
+        data_p2 = collect_part2_data(grades)
         buf_p2 = generate_part2_docx(data_p2)
         st.download_button(
             label="Download Part 2 (DOCX)",
@@ -1233,7 +1285,10 @@ def main():
     with tab2:
         render_part2()
 
-    render_downloads()
+    # Both documents share one grade computation from the final widget values
+    grades = compute_weighted_grade(
+        st.session_state.thesis_points or 0, st.session_state.defense_points or 0)
+    render_downloads(grades)
 
 
 if __name__ == "__main__":